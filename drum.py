@@ -9,28 +9,49 @@
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!#
 
 import serial
+from serial.tools import list_ports
 import threading
 import queue
 import numpy
 import time
 
+# Prefixes of the replies sent back by the device
+ERR_PREFIX = b"ERR:"
+_A_SET_RESP = b"a_set"
+_R_SET_RESP = b"r_set"
+_A_GO_RESP = b"a_go"
+_R_GO_RESP = b"r_go"
+_A_IDLE_RESP = b"a_idle"
+_R_IDLE_RESP = b"r_idle"
+
 class Vibrating_Plate:
     D_NONE = 0
     D_INFO = 1
     D_OPEN = 2
     D_ALL = 3
 
+    # Command prefixes, prebuilt so the hot paths only format the argument
+    _A_SET = b"a_set "
+    _R_SET = b"r_set "
+    _A_GO = b"a_go "
+    _R_GO = b"r_go "
+    _NL = b"\n"
+
     def __init__(self,debug=D_ALL):
         self._handle = False
         self.debug = debug
         
-        # Attemp to open device by trying all COM ports from 5 to 10
+        # Attemp to open device by trying the COM ports from 5 to 10,
+        # skipping any that aren't present on this machine.
+        present = set(port.device for port in list_ports.comports())
         for i in range(5,10):
+            device = "COM%d" % (i)
+            if device not in present:
+                continue
             try:
-                device = "COM%d" % (i)
                 if self.D_OPEN & self.debug: print("Attempting '%s'"%(device))
                 self._handle = serial.Serial(device,115200) # 115200 = Data Rate
-            except :
+            except serial.SerialException:
                 print("except")
                 continue
             break
@@ -40,7 +61,7 @@ class Vibrating_Plate:
         print("Got device %s" % (device))
 
         # Open queue for threaded communication with device.
-        self._queue = queue.Queue()
+        self._queue = queue.SimpleQueue()
         t = threading.Thread(target=self._reader)
         t.daemon = True
         t.start()
@@ -49,11 +70,20 @@ class Vibrating_Plate:
             self._debug_print("resetting")
             self._handle.write(b"reset\n")
 
+    # Writes several commands to the device in a single call
+    def _send(self,*commands):
+        self._handle.write(b"".join(commands))
+
     def _reader(self):
         self._debug_print("reader starts")
+        # Read whatever has arrived in one call (blocking for at least a byte)
+        # and split it into lines, rather than readline's byte-at-a-time reads.
+        buf = b""
         while True:
-            str = self._handle.readline()
-            self._queue.put(str)
+            buf += self._handle.read(max(1, self._handle.in_waiting))
+            while b"\n" in buf:
+                line, _, buf = buf.partition(b"\n")
+                self._queue.put(line + b"\n")
 
     # Wait for message matching "str", with max wait time "timeout"
     def _timeout_for(self,str,timeout):
@@ -61,9 +91,7 @@ class Vibrating_Plate:
             try:
                 resp = self._queue.get(block=True,timeout=timeout)
                 self._debug_print("after get")
-                self._queue.task_done()
-                rc = resp.find(str)  
-                if 0 == rc : return resp
+                if resp.startswith(str): return resp
                 print("UnMatched: %s" % (resp.decode()))
             except queue.Empty:
                 self._debug_print("exception")
@@ -73,15 +101,13 @@ class Vibrating_Plate:
     def _wait_for(self,str,timeout=None):
         while True:
             resp = self._queue.get()
-            self._queue.task_done()
             if 0:
                 print((b"wait_for() read: "),)
                 print((resp),)
-            if "ERR:" == resp[0:4]:
+            if resp.startswith(ERR_PREFIX):
                 print(resp)
-                raise RuntimeError
-            rc = resp.find(str)  
-            if 0 == rc : return resp
+                raise RuntimeError(resp.decode(errors="replace").strip())
+            if resp.startswith(str): return resp
             print(b"Unmatched: %s" % (resp),)
 
     # Set debug mode? Not really sure yet.
@@ -98,44 +124,40 @@ class Vibrating_Plate:
 
     # Sets the pulse time for the angular motor
     def _angular_set(self,dt):
-        command = b"a_set %f\n" % (dt)
-        self._handle.write(command);
-        resp = self._wait_for(b"a_set")
+        self._send(self._A_SET, f"{dt:f}".encode(), self._NL)
+        resp = self._wait_for(_A_SET_RESP)
         words = resp.split(b" ")
         return int(words[1])/48e3 # samples/samplerate
 
     # Sets the pulse time for the radial motor
     def _radial_set(self,dt):
-        command = b"r_set %f\n" % (dt)
-        self._handle.write(command);
-        resp = self._wait_for(b"r_set")
+        self._send(self._R_SET, f"{dt:f}".encode(), self._NL)
+        resp = self._wait_for(_R_SET_RESP)
         words = resp.split(b" ")
         return int(words[1])/48e3 # samples/samplerate
 
     # Sends the angular motor the given number of steps.
     def _angular_go(self,steps):
-        command = b"a_go %d\n" % (steps)
-        self._handle.write(command);
-        self._wait_for(b"a_go")
+        self._send(self._A_GO, str(steps).encode(), self._NL)
+        self._wait_for(_A_GO_RESP)
         return True
 
     # Sends the radial motor the given number of steps.
     def _radial_go(self,steps):
-        command = b"r_go %d\n" % (steps)
-        self._handle.write(command);
-        self._wait_for(b"r_go")
+        self._send(self._R_GO, str(steps).encode(), self._NL)
+        self._wait_for(_R_GO_RESP)
         return True
 
     # Returns true if the angular motor is not moving
     def _angular_idle(self):
         self._handle.write(b"a_idle\n")
-        resp = self._wait_for(b"a_idle")
+        resp = self._wait_for(_A_IDLE_RESP)
         return b"true" == resp[7:11]
 
     # Returns true if the radial motor is not moving
     def _radial_idle(self):
         self._handle.write(b"r_idle\n")
-        resp = self._wait_for(b"r_idle")
+        resp = self._wait_for(_R_IDLE_RESP)
         return b"true" == resp[7:11]
 
     # Home the angular motor
@@ -157,16 +179,54 @@ class Vibrating_Plate:
             return False
         return True
 
+    # Returns which of the selected motors are still moving, as (angular, radial).
+    # The queries are sent in a single write and the replies reaped after,
+    # motors that aren't selected are neither queried nor reported as moving.
+    def _busy(self,angular=True,radial=True):
+        commands = []
+        if angular: commands.append(b"a_idle\n")
+        if radial: commands.append(b"r_idle\n")
+        if not commands:
+            return False, False
+        self._send(*commands)
+        a_busy = angular and b"true" != self._wait_for(_A_IDLE_RESP)[7:11]
+        r_busy = radial and b"true" != self._wait_for(_R_IDLE_RESP)[7:11]
+        return a_busy, r_busy
+
+    # Returns true if neither motor is moving.
+    def _both_idle(self):
+        return not any(self._busy())
+
+    # Waits until neither motor is moving, backing off exponentially between
+    # polls so the serial line isn't flooded with idle queries.
+    def _wait_both_idle(self):
+        delay = 0.001
+        while not self._both_idle():
+            time.sleep(delay)
+            delay = min(delay*2, 0.05)
+
+    # Sends both motors a given number of steps without waiting for them to finish.
+    # Both move commands are submitted back to back, then the acknowledgements reaped.
+    def _dual_go(self,angular,radial):
+        commands = []
+        if (angular != 0): commands += [self._A_GO, str(angular).encode(), self._NL]
+        if (radial != 0): commands += [self._R_GO, str(radial).encode(), self._NL]
+        if commands:
+            self._send(*commands)
+            if (angular != 0): self._wait_for(_A_GO_RESP)
+            if (radial != 0): self._wait_for(_R_GO_RESP)
+        return True
+
     # Sends both motors a given number of steps and waits until they're both
     # done moving
     def _go_and_wait(self,angular,radial):
-        while not (self._angular_idle() and self._radial_idle()): True
-        if (angular != 0): self._angular_go(angular)
-        if (radial != 0): self._radial_go(radial)
-        while not (self._angular_idle() and self._radial_idle()): True
+        self._wait_both_idle()
+        self._dual_go(angular,radial)
+        self._wait_both_idle()
         return True
 
     # Added by Rigel:
-    def _debug_print(self, message):
+    # Any args are %-formatted into message, only when it's actually printed.
+    def _debug_print(self, message, *args):
         if self.debug:
-            print(message)
+            print(message % args if args else message)
@@ -3,7 +3,6 @@
 import serial
 import threading
 import queue
-import numpy
 import time
 
 class Vibrating_Plate:
@@ -28,17 +27,19 @@ class Vibrating_Plate:
 
     # Sends the angular motor the given number of steps.
     def _angular_go(self,steps):
-        while abs(steps) != 0:
+        while steps:
             print("Angular Moving: %d" % steps, end="\r")
-            steps = steps - numpy.copysign(numpy.min([50,abs(steps)]),steps)
+            chunk = 50 if abs(steps) >= 50 else abs(steps)
+            steps -= chunk if steps > 0 else -chunk
             time.sleep(self.angulardt)
         print("Angular Move: 0                    ")
 
     # Sends the radial motor the given number of steps.
     def _radial_go(self,steps):
-        while abs(steps) != 0:
+        while steps:
             print("Radial Moving: %d" % steps, end="\r")
-            steps = steps - numpy.copysign(numpy.min([50,abs(steps)]),steps)
+            chunk = 50 if abs(steps) >= 50 else abs(steps)
+            steps -= chunk if steps > 0 else -chunk
             time.sleep(self.radialdt)
         print("Radial Move: 0                     ")
 
@@ -50,19 +51,33 @@ class Vibrating_Plate:
     def _radial_idle(self):
         return True
 
+    # Returns which of the selected motors are still moving, as (angular, radial).
+    def _busy(self,angular=True,radial=True):
+        return (angular and not self._angular_idle(),
+                radial and not self._radial_idle())
+
+    # Waits until neither motor is moving, backing off exponentially between
+    # polls.
+    def _wait_both_idle(self):
+        delay = 0.001
+        while any(self._busy()):
+            time.sleep(delay)
+            delay = min(delay*2, 0.05)
+
     # Sends both motors a given number of steps and waits until they're both
     # done moving
     def _go_and_wait(self,angular,radial):
-        while not (self.angular_idle() and self.radial_idle()): True
-        if (angular != 0): self.angular_go(angular)
-        if (radial != 0): self.radial_go(radial)
-        while not (self.angular_idle() and self.radial_idle()): True
+        self._wait_both_idle()
+        if (angular != 0): self._angular_go(angular)
+        if (radial != 0): self._radial_go(radial)
+        self._wait_both_idle()
         return True
 
     # Added by Rigel:
-    def _debug_print(self, message):
+    # Any args are %-formatted into message, only when it's actually printed.
+    def _debug_print(self, message, *args):
         if self.debug:
-            print(message)
+            print(message % args if args else message)
 
     def _angular_home(self):
         time.sleep(0.1)
@@ -8,9 +8,12 @@
 import drum # For real use
 #import dummy_drum as drum # For Testing
 import numpy as np
+import math
 import time
 from datetime import datetime
 
+# This is fixed by the motor, so angles are wrapped with % rather than by masking
+# with & as would be possible for a power of two step count.
 ANG_MAX_STEPS = 720 # Number of steps that make a full circle
 ANG_MIN_STEPS = 0 # Initial steps in case we want a specific physical angle to be 0 in the future.
 
@@ -20,10 +23,19 @@ RAD_MAX_STEPS = 10000 # Number of steps from the center to corner of plate
 RAD_MAX_SAFE  = 7300 # Number of steps from center to edge of plate
 RAD_MIN_STEPS = 0 # Initial steps in case we want a specific radius to be 0.
 
+# Waiting for the motors to stop: poll this many times with a short sleep so quick
+# moves return promptly, then fall back to a longer sleep for slow ones.
+POLL_IDLE_RELAX_COUNT = 200
+POLL_FAST_SLEEP = 0.0005 # seconds
+POLL_SLOW_SLEEP = 0.05 # seconds
+
 ######################################
 # Safe Vibrating Plate Control Class #
 ######################################
 class SafePlate(drum.Vibrating_Plate):
+    # The position and shape are read on every move, so keep them in slots
+    __slots__ = ("_radial", "_angular", "_shape", "_is_square")
+
     def __init__(self, debug=True, shape="circle"):
         """ A safe wraper for controlling the vibrating plate lab.
             Everytime an instance is opened, the experiment is homed, this uses limit switches
@@ -68,12 +80,17 @@ class SafePlate(drum.Vibrating_Plate):
             "circle" or "square", by default circle.
         """
         super().__init__(debug)
+        if not debug:
+            # Skip the call overhead of debug messages entirely
+            self._debug_print = lambda *args: None
+        self._shape = shape
+        # Resolved once here so the motion and safety checks don't compare strings
+        self._is_square = (shape == "square")
         # Home the instrument on every startup, that way we are always at 0,0
         # from the beginning
         self._radial = RAD_MIN_STEPS
         self._angular = ANG_MIN_STEPS
         self.home()
-        self._shape = shape
 
     def get_radial(self):
         return self._radial
@@ -123,10 +140,12 @@ class SafePlate(drum.Vibrating_Plate):
 
         Parameters
         ----------
-        rad_steps : int
+        rad_steps : int or float
             The position, in steps, relative to zero to move the radial position to.
-        ang_steps : int
+            Rounded to the nearest step.
+        ang_steps : int or float
             The position, in steps, relative to zero to move the angular position to.
+            Rounded to the nearest step.
 
         Raises
         ------
@@ -134,67 +153,153 @@ class SafePlate(drum.Vibrating_Plate):
             Will return this error if the radius is attempted to be set outside of the max range,
             or if it's set to a radius that is incompatible with the desired angular position.
         """
-        # Ensure integers, or integer like numbers are passed
-        rad_steps = int(rad_steps)
-        ang_steps = int(ang_steps)
-        if not self.safe_polar(rad_steps, ang_steps/2):
-            if self._shape is "square":
-                raise ValueError("Radial position %d outside safe range %d for angular steps %d" % 
-                                 (rad_steps, squine(ang_steps), ang_steps))
-            if self._shape is "circle":
-                raise ValueError("Radial position %d outside safe range %d" %
-                                 (rad_steps, RAD_MAX_SAFE))
-
-        # Take absolute position around single rotation of circle
-        ang_delta = (ang_steps % ANG_MAX_STEPS) - self._angular
-        ang_first = False
-        if self._shape is "square":
-            # Flags that modify how the motion should be handled
-            retreat = False
-            ang_first = False
-            # If the radius is outside the safe range and we're rotating
-            # we need to first pull in the sensor, then do the rotation
-            # and finally set the radius to the correct amount.
-            safe_dists = squine(np.linspace(self._angular,ang_steps,np.abs(self._angular-ang_steps)+1,dtype=int))
-            safe_dist = np.min(safe_dists)
-            if (ang_delta != 0 and self._radial > safe_dist):
-                retreat = True
-            # If we're moving outside the safe radial distance, we want to rotate first.
-            if (rad_steps > RAD_MAX_SAFE):
-                ang_first = True
-
-            # If we're past the safe rotating radius, pull the radius in.
-            if retreat:
-                self._debug_print("Retreating radius for rotation by %d steps" % ang_delta)
-                # If the target radius is within the safe limit, go there
-                # otherwise, move to the minimum safe distance.
-                self.rad_move_abs(safe_dist)
+        # Round to whole steps, this is the only place positions get rounded.
+        # Ints are already whole, which is what the internal wrappers pass.
+        if type(rad_steps) is not int:
+            rad_steps = round(float(rad_steps))
+        if type(ang_steps) is not int:
+            ang_steps = round(float(ang_steps))
+        # Take absolute position around single rotation of circle, once for everything below
+        ang_steps %= ANG_MAX_STEPS
+        # Look up the limit once, it's reused in the error message.
+        max_rad = squine(ang_steps) if self._is_square else RAD_MAX_SAFE
+        if rad_steps < RAD_MIN_STEPS or rad_steps > max_rad:
+            self._raise_unsafe(rad_steps, ang_steps, max_rad)
+        self._move(rad_steps, ang_steps)
+
+    def move_abs_batch(self, positions):
+        """ Steps the radial and angular motors through a sequence of absolute positions,
+            in order, stopping at each one.
+            Every position is checked before any motion happens, so a scan with an unsafe
+            point raises without moving the sensor at all, rather than partway through.
+            Each move takes the same precautions as move_abs(), see that documentation for more info.
+
+        Parameters
+        ----------
+        positions : array_like
+            An Nx2 array of (radial, angular) positions, in steps relative to zero.
+
+        Raises
+        ------
+        ValueError
+            Will return this error if any of the positions is outside the safe range,
+            in the same way as move_abs(), or if positions isn't an Nx2 array.
+        """
+        positions = np.atleast_2d(np.rint(positions).astype(int))
+        # A 2xN array of separate radii and angles would otherwise be read as pairs
+        if positions.ndim != 2 or positions.shape[1] != 2:
+            raise ValueError("Positions must be an Nx2 array of (radial, angular) pairs, got shape %s" %
+                             (positions.shape,))
+        positions[:,1] %= ANG_MAX_STEPS
+        safe = self._safe_steps(positions[:,0], positions[:,1])
+        if not np.all(safe):
+            rad_steps, ang_steps = positions[np.argmin(safe)].tolist()
+            self._raise_unsafe(rad_steps, ang_steps,
+                               squine(ang_steps) if self._is_square else RAD_MAX_SAFE)
+        for rad_steps, ang_steps in positions.tolist():
+            self._move(rad_steps, ang_steps)
+
+    def _raise_unsafe(self, rad_steps, ang_steps, max_rad):
+        """ Raises the ValueError describing why (rad_steps, ang_steps) is not a safe position,
+            given the maximum safe radius max_rad at that angle.
+        """
+        if self._is_square:
+            raise ValueError("Radial position %d outside safe range %d for angular steps %d" % 
+                             (rad_steps, max_rad, ang_steps))
+        raise ValueError("Radial position %d outside safe range %d" %
+                         (rad_steps, max_rad))
+
+    def _move(self, rad_steps, ang_steps):
+        """ Moves to an already validated position (rad_steps, ang_steps), in whole steps
+            with the angle wrapped into [0, ANG_MAX_STEPS), retreating the radius first
+            if the rotation requires it.
+        """
+        cur_ang = self._angular
+        ang_delta = ang_steps - cur_ang
+        # Already there, e.g. the held axis of a raster scan: nothing to send or wait on.
+        if ang_delta == 0 and rad_steps == self._radial:
+            return
+
+        # Flags that modify how the motion should be handled. Only rotations on the
+        # square plate can bring the sensor into a wall, so pure radial moves and the
+        # circle skip the range lookup entirely.
+        rotating = self._is_square and ang_delta != 0
+        if rotating:
+            # The motor sweeps directly from the current angle to the target.
+            safe_dist = int(_SQUINE_RANGE_MIN[cur_ang, ang_steps])
+        # If the radius is outside the safe range and we're rotating
+        # we need to first pull in the sensor, then do the rotation
+        # and finally set the radius to the correct amount.
+        retreat = rotating and self._radial > safe_dist
+        # If we're moving outside the safe radial distance, we want to rotate first.
+        ang_first = rotating and rad_steps > RAD_MAX_SAFE
+
+        # If we're past the safe rotating radius, pull the radius in.
+        if retreat:
+            self._debug_print("Retreating radius for rotation by %d steps", ang_delta)
+            # If the target radius is within the safe limit, go there
+            # otherwise, move to the minimum safe distance.
+            self.rad_move_abs(safe_dist)
         # Calculate number of steps needed to move radially.
         # Put here since retreating will change this.
         rad_delta = rad_steps - self._radial
 
-        self._debug_print("Moving to %d, %d" % (self._radial + rad_delta, self._angular + ang_delta))
+        self._debug_print("Moving to %d, %d", self._radial + rad_delta, self._angular + ang_delta)
 
         # If there is motion to do, send the motors that number of steps
         # and wait until idle.
-        if ang_delta != 0:
+        if ang_first:
+            # The angular motion has to finish before the radial motion starts.
             self._angular_go(ang_delta)
-            # If we need the angular motion to finish before the radial motion starts, wait here.
-            if ang_first:
-                self._debug_print("Rotating Angle First")
-                while not self._angular_idle():
-                    time.sleep(0.1)
-        if rad_delta != 0:
-            self._radial_go(rad_delta)
+            self._debug_print("Rotating Angle First")
+            self._wait_idle(radial=False)
+            if rad_delta != 0:
+                self._radial_go(rad_delta)
+        else:
+            self._move_both(rad_delta, ang_delta)
 
-        # Wait for all movement to stop.
-        while not (self._radial_idle() or self._angular_idle()):
-            time.sleep(0.1)
+        # Wait for the motors that moved to stop, if the angle went first it already has.
+        self._wait_idle(radial=rad_delta != 0, angular=ang_delta != 0 and not ang_first)
 
         # Register the new changes
         self._angular += ang_delta
         self._radial += rad_delta
-        self._debug_print("Final Position: %d, %d" % (self._radial, self._angular))
+        self._debug_print("Final Position: %d, %d", self._radial, self._angular)
+
+    def _move_both(self, rad_delta, ang_delta):
+        """ Sends both motors their steps back to back without waiting in between.
+            Uses the plate's combined _dual_go submission when it has one.
+        """
+        dual_go = getattr(self, "_dual_go", None)
+        if dual_go is not None:
+            dual_go(ang_delta, rad_delta)
+            return
+        if ang_delta != 0:
+            self._angular_go(ang_delta)
+        if rad_delta != 0:
+            self._radial_go(rad_delta)
+
+    def _wait_idle(self, radial=True, angular=True, fast_spins=POLL_IDLE_RELAX_COUNT,
+                   fast_sleep=POLL_FAST_SLEEP, slow_sleep=POLL_SLOW_SLEEP):
+        """ Blocks until the selected motors have stopped, by default both of them.
+            The motors still moving are queried together, and a motor that has
+            reported idle is not polled again.
+            Polls fast_spins times with a short sleep first, so short moves return
+            promptly, then slows down so long moves don't flood the device with queries.
+        """
+        busy = self._busy
+
+        def idle():
+            nonlocal angular, radial
+            angular, radial = busy(angular, radial)
+            return not (angular or radial)
+
+        for _ in range(fast_spins):
+            if idle():
+                return
+            time.sleep(fast_sleep)
+        while not idle():
+            time.sleep(slow_sleep)
 
     def rad_move_rel(self, steps):
         """ Step the radial motor by a given number of steps.
@@ -207,7 +312,7 @@ class SafePlate(drum.Vibrating_Plate):
             Positive number indicates forward motion.
             Negative number indicates backwards motion.
         """
-        self.move_rel(steps, 0)
+        self.move_abs(self._radial + steps, self._angular)
 
     def rad_move_abs(self, steps):
         """ Steps the radial motor to an absolute position given by 'steps' from zero.
@@ -231,7 +336,7 @@ class SafePlate(drum.Vibrating_Plate):
             Positive number indicates clockwise motion (looking from above).
             Negative number indicates counterclockwise motion (looking from above).
         """
-        self.move_rel(0, steps)
+        self.move_abs(self._radial, self._angular + steps)
 
     def ang_move_abs(self, steps):
         """Steps the angular motor to an absolute position given by 'steps' from zero.
@@ -268,9 +373,9 @@ class SafePlate(drum.Vibrating_Plate):
 
         Parameters
         ----------
-        x : int
+        x : int or float
             The position in steps along the x axis to posotion the sensor.
-        y : int 
+        y : int or float
             The position in steps along the y axis to posotion the sensor.
         Raises
         ------
@@ -278,26 +383,16 @@ class SafePlate(drum.Vibrating_Plate):
             Will return an error if the given coordinates are outisde the range set
             by +/- the maximum safe radius.
         """
-        # Ensure integers, or integer like numbers are passed
-        x = int(x)
-        y = int(y)
-        
         # Assert values are within range
         if not self.safe_xy(x,y):
-            if self._shape is "square":
+            if self._is_square:
                 raise ValueError("Position (%d, %d) contains value outside safe range of %d-%d." % 
                                 (x,y, -RAD_MAX_SAFE, RAD_MAX_SAFE))
-                raise ValueError("Position (%d, %d) produces radius %d outside limit of %d." % 
-                                (x,y, int(round(np.sqrt(x**2+y**2))), RAD_MAX_SAFE))
+            raise ValueError("Position (%d, %d) produces radius %d outside limit of %d." % 
+                            (x,y, int(round(np.sqrt(x**2+y**2))), RAD_MAX_SAFE))
 
-        # Convert x,y to r,theta
-        r,theta = xy_to_polar(x,y)
-        # Convert to steps
-        # This will probably introduce some rounding error...
-        radial = int(round(r))
-        angular = int(round(theta * 2))
-
-        self.move_abs(radial, angular)
+        # Convert x,y to steps, move_abs does the rounding
+        self.move_abs(*xy_to_steps(x,y))
 
     def cart_move_rel(self, x, y):
         """ Steps the radial and angular motors to move relative to the current position a number
@@ -308,22 +403,16 @@ class SafePlate(drum.Vibrating_Plate):
 
         Parameters
         ----------
-        x : int
+        x : int or float
             The number of steps to move along the x-axis
-        y : int
+        y : int or float
             The number of steps to move along the y-axis
         """
         # Get current position in cartesian
-        x_cur, y_cur = polar_to_xy(self._radial, self._angular/2)
-        # This will probably introduce some rounding error...
-        x_cur = int(round(x_cur))
-        y_cur = int(round(y_cur))
-
-        # Compute new absolute cartesian coordinates
-        new_x = x + x_cur
-        new_y = y + y_cur
+        x_cur, y_cur = steps_to_xy(self._radial, self._angular)
 
-        self.cart_move_abs(new_x, new_y)
+        # Compute new absolute cartesian coordinates, only rounded once in move_abs
+        self.cart_move_abs(x + x_cur, y + y_cur)
 
     def safe_polar(self, radial, angular):
         """ Returns true if the given polar coordinates are safe for the vibrating plate.
@@ -332,24 +421,51 @@ class SafePlate(drum.Vibrating_Plate):
 
         Parameters
         ----------
-        r : int or float
-            The radius of the given position. To be safe, this value must be within
+        radial : int, float or array
+            The radius of the given position in steps. To be safe, this value must be within
             the minimal safe radius, and the maximum safe radius for the given angle.
-        theta : int or float
-            The angle of the given position. This has no limitations as the angle
+        angular : int, float or array
+            The angle of the given position in steps. This has no limitations as the angle
             will be automatically wrapped if it exceeds a full turn.
 
         Returns
         -------
-        bool
+        bool or array of bool
             Returns true if the position is safe, and false otherwise.
+            Array inputs are checked elementwise.
+        """
+        # Rounded to whole steps, as move_abs() does
+        return self._safe_steps(np.rint(radial).astype(int), np.rint(angular).astype(int))
+
+    def validate_path(self, rad_steps, ang_steps):
+        """ Returns true if every position of a planned path is safe for the vibrating plate.
+            Positions are given in motor steps, as for move_abs(), and are all checked in a
+            single vectorized pass by safe_polar(), so a whole scan can be validated before
+            it is started.
+
+        Parameters
+        ----------
+        rad_steps : array of int or float
+            The radial positions of the path, in steps. Rounded to the nearest step,
+            as move_abs() does.
+        ang_steps : array of int or float
+            The angular positions of the path, in steps. Rounded to the nearest step,
+            and wrapped if they exceed a full turn.
+
+        Returns
+        -------
+        bool
+            Returns true if all positions are safe, and false otherwise.
+        """
+        return bool(np.all(self.safe_polar(rad_steps, ang_steps)))
+
+    def _safe_steps(self, rad_steps, ang_steps):
+        """ Elementwise safety check of positions given in whole steps.
         """
-        radial = int(round(radial))
-        angular = int(round(angular))
-        if self._shape is "square":
-            return not (radial < RAD_MIN_STEPS or radial > squine(angular))
-        elif self._shape is "circle":
-            return not (radial < RAD_MIN_STEPS)
+        if self._is_square:
+            # take(mode='wrap') folds the angle into one turn as part of the lookup
+            return (rad_steps >= RAD_MIN_STEPS) & (rad_steps <= _SQUINE_LUT.take(ang_steps, mode='wrap'))
+        return (rad_steps >= RAD_MIN_STEPS) & (rad_steps <= RAD_MAX_SAFE)
 
     def safe_xy(self, x,y):
         """ Returns true if the given cartesian coordinates are safe for the vibrating drum.
@@ -358,24 +474,31 @@ class SafePlate(drum.Vibrating_Plate):
 
         Parameters
         ----------
-        x : int or float
+        x : int, float or array
             The x coordinate of the given position. To be safe this value must be 
             within +/- the maximum safe radius
-        y : int or float
+        y : int, float or array
             The y coordinate of the given position. To be safe this value must be 
             within +/- the maximum safe radius
 
         Returns
         -------
-        bool
+        bool or array of bool
             Returns true if the position is safe, and false otherwise.
+            Array inputs are checked elementwise.
         """
-        if self._shape is "square":
-            checks = [(pos < -RAD_MAX_SAFE or pos > RAD_MAX_SAFE) for pos in [x,y]]
-            return not any(checks)
-        if self._shape is "circle":
-            r, theta = xy_to_polar(x,y)
-            return r <= RAD_MAX_SAFE
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            # Single points: reject anything outside the bounding square first,
+            # which is all the square plate needs and spares the circle the multiplies.
+            if abs(x) > RAD_MAX_SAFE or abs(y) > RAD_MAX_SAFE:
+                return False
+            return self._is_square or x*x + y*y <= RAD_MAX_SAFE*RAD_MAX_SAFE
+        x = np.asarray(x)
+        y = np.asarray(y)
+        if self._is_square:
+            return (np.abs(x) <= RAD_MAX_SAFE) & (np.abs(y) <= RAD_MAX_SAFE)
+        # Compare squared radii rather than taking a square root
+        return (x*x + y*y) <= RAD_MAX_SAFE*RAD_MAX_SAFE
 ####################
 # Helper Functions #
 ####################
@@ -383,7 +506,7 @@ def xy_to_polar(x,y):
     """ Converts a set of cartesian coordinates (x,y) into their polar counterparts (r,theta).
         By convention this will return (0,0) when the input is (0,0) keep that in mind as it may lead
         to interesting behaviour when scanning through cartesian coordinates.
-        For more info, read numpy's arctan2 documentation.
+        For more info, read the documentation of Python's math.atan2.
 
     Parameters
     ----------
@@ -397,8 +520,8 @@ def xy_to_polar(x,y):
     float,float
         The corresponding polar coordinates.
     """
-    r = np.sqrt(x**2 + y**2)
-    theta = np.degrees(np.arctan2(y,x))
+    r = math.hypot(x, y)
+    theta = math.degrees(math.atan2(y,x))
     return r,theta
 
 def polar_to_xy(r,theta):
@@ -409,22 +532,100 @@ def polar_to_xy(r,theta):
     r : int or float
         The radius coordinate.
     theta : int or float
-        The angle coordinate.
+        The angle coordinate in degrees, as returned by xy_to_polar.
 
     Returns
     -------
     float, float
         The corresponding cartesian coordinates.
     """
-    x = r * np.cos(theta)
-    y = r * np.sin(theta)
+    theta = math.radians(theta)
+    x = r * math.cos(theta)
+    y = r * math.sin(theta)
     return x,y
 
+# Angle in radians of every whole angular step, and its cosine and sine, so the
+# plate's own (integer) position can be converted without any trig.
+_theta = (np.arange(ANG_MAX_STEPS)/ANG_MAX_STEPS) * 2 * np.pi
+_COS_LUT = np.cos(_theta)
+_SIN_LUT = np.sin(_theta)
+
+def xy_to_steps(x,y):
+    """ Converts a set of cartesian coordinates (x,y) into motor positions (radial, angular),
+        both in steps, skipping the intermediate conversion to degrees.
+        Like xy_to_polar, this returns (0,0) when the input is (0,0).
+
+    Parameters
+    ----------
+    x : int or float
+        The x coordinate.
+    y : int or float
+        the y coordinate.
+
+    Returns
+    -------
+    float,float
+        The corresponding radial and angular positions in steps, not yet rounded.
+    """
+    return math.hypot(x, y), math.atan2(y,x) * (ANG_MAX_STEPS / (2 * math.pi))
+
+def steps_to_xy(rad_steps, ang_steps):
+    """ Converts motor positions (radial, angular) in steps into cartesian coordinates (x,y).
+        The angular position must be a whole number of steps, which lets this use
+        precomputed tables rather than evaluating any trig functions.
+
+    Parameters
+    ----------
+    rad_steps : int or float
+        The radial position in steps.
+    ang_steps : int
+        The angular position in steps.
+
+    Returns
+    -------
+    float, float
+        The corresponding cartesian coordinates.
+    """
+    i = ang_steps % ANG_MAX_STEPS
+    return rad_steps * _COS_LUT[i], rad_steps * _SIN_LUT[i]
+
 # For a given angle theta, max radial position is squine(theta)
 # Here's a function for getting that as a function of angular steps
 # Not good enough since the sensor has some width to it.
 # For now gonna try multiplying by (0.91 + 0.09 * cos(2*theta)**2) in order
 # to smoothly go from edge at angle 0 to corner at angle 45.
+# Since angular positions are whole steps, there are only ANG_MAX_STEPS distinct
+# values, so they are tabulated once here and squine() just looks them up.
+# min(1/|cos|, 1/|sin|) is written as 1/max(|cos|, |sin|), whose denominator is
+# never below 1/sqrt(2), so there is no divide by zero to suppress.
+# The table is also clamped to the radial travel, so no entry can exceed what the
+# motor's range allows however the geometry factors are tuned.
+_SQUINE_LUT = np.minimum((0.91 + 0.09 * np.cos(2*_theta)**2) * RAD_MAX_SAFE
+                         / np.maximum(np.abs(_COS_LUT), np.abs(_SIN_LUT)),
+                         RAD_MAX_STEPS).astype(np.int32)
+# Public name for the table: the maximum safe radius in steps at each angular step,
+# for checking planned paths in bulk, e.g. np.all(rad <= SAFE_RAD_LUT[ang % ANG_MAX_STEPS])
+# Read-only, so it can't be edited out of step with the tables derived from it below.
+_SQUINE_LUT.flags.writeable = False
+SAFE_RAD_LUT = _SQUINE_LUT
+
+# Minimum of the squine table over every range of angles, precomputed for all
+# pairs of endpoints: _SQUINE_RANGE_MIN[a, b] == squine over a..b inclusive, in
+# either order. At 720x720 int32 this is about 2 MB.
+def _build_range_min(values):
+    n = len(values)
+    table = np.empty((n, n), dtype=values.dtype)
+    for start in range(n):
+        run = np.minimum.accumulate(values[start:])
+        table[start, start:] = run
+        table[start:, start] = run
+    return table
+
+_SQUINE_RANGE_MIN = _build_range_min(_SQUINE_LUT)
+_SQUINE_RANGE_MIN.flags.writeable = False
+# The same table as a list, for cheap lookups with a single Python int
+_SQUINE_LIST = _SQUINE_LUT.tolist()
+
 def squine(angular):
     """Calculates the absolute maximum radius for a given angular (in steps) position.
        This is effectively the distance between the center of a square and it's perimiter
@@ -437,8 +638,8 @@ def squine(angular):
 
     Parameters
     ----------
-    angular : int
-        the angular position in steps.
+    angular : int, float or array
+        the angular position in steps, rounded to the nearest step.
 
     Returns
     -------
@@ -446,21 +647,28 @@ def squine(angular):
         the maximum position in steps of the radial motor for the sensor to not
         collide with the walls.
     """
-    theta = (angular/ANG_MAX_STEPS) * 2 * np.pi
-    multiple = (0.91 + 0.09 * np.cos(2*theta)**2) * RAD_MAX_SAFE
-    # Don't care about divide by zero within the following math
-    with np.errstate(divide='ignore'):
-        return  multiple * np.min(np.abs([1/np.cos(theta), 1/np.sin(theta)]), axis=0)
+    # Plain ints skip numpy's dispatch entirely
+    if isinstance(angular, int):
+        return _SQUINE_LIST[angular % ANG_MAX_STEPS]
+    return _SQUINE_LUT.take(np.rint(angular).astype(int), mode='wrap')
 
 # Testing will remove
 if __name__ == "__main__":
-    plate = SafePlate()
-    # Test Polar Bounds
-    for i in range(0,365,5):
-        print(i)
-        plate.move_abs(squine(i),i)
-    # Test Cartesian Bounds
+    shape = "square"
+    plate = SafePlate(shape=shape)
+    # Test Polar Bounds, out to the largest safe radius for the plate's shape
+    angles = np.arange(0,365,5)
+    if shape == "square":
+        radii = squine(angles)
+    else:
+        radii = np.full(len(angles), RAD_MAX_SAFE)
+    plate.move_abs_batch(np.column_stack([radii, angles]))
+    # Test Cartesian Bounds, along the diagonal, skipping the corners
+    # that are past the plate's safe radius
     for i in range(-7000,7200,200):
+        rad, ang = xy_to_steps(i,i)
+        if not plate.validate_path([rad], [ang]):
+            continue
         print(i)
         plate.cart_move_abs(i,i)
     plate.move_abs(0,0)